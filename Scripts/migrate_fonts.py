@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Migrate project.pbxproj: replace 18 Overpass static fonts with 2 Inter variable fonts.
+Run from repo root: python3 Scripts/migrate_fonts.py
+"""
+
+import mmap
+import os
+
+INTER_REF          = "AA0001002F477D4A0010A953"
+INTER_ITALIC_REF   = "AA0002002F477D4A0010A953"
+INTER_BUILD        = "AA0003002F477D4A0010A953"
+INTER_ITALIC_BUILD = "AA0004002F477D4A0010A953"
+FONTS_GROUP_UUID   = "D69F99D72F477D4A0010A953"
+RESOURCES_UUID     = "D62A098F2F0D7B0D004AF1FA"
+PBXPROJ            = "Tenra.xcodeproj/project.pbxproj"
+
+# The pbxproj and every marker below are pure ASCII, so the whole migration
+# runs on bytes: no unicode decode/encode of the project file. The read side
+# is memory-mapped; the write goes through a single 1 MiB buffer instead of
+# the 8 KiB default.
+BUFFER_SIZE = 1 << 20
+
+INTER_BUILD_ENTRIES = (
+    f'\t\t{INTER_BUILD} /* Inter-VariableFont_opsz,wght.ttf in Resources */ = '
+    f'{{isa = PBXBuildFile; fileRef = {INTER_REF} /* Inter-VariableFont_opsz,wght.ttf */; }};\n'
+    f'\t\t{INTER_ITALIC_BUILD} /* Inter-Italic-VariableFont_opsz,wght.ttf in Resources */ = '
+    f'{{isa = PBXBuildFile; fileRef = {INTER_ITALIC_REF} /* Inter-Italic-VariableFont_opsz,wght.ttf */; }};\n'
+).encode("ascii")
+
+INTER_FILE_REFS = (
+    f'\t\t{INTER_REF} /* Inter-VariableFont_opsz,wght.ttf */ = '
+    f'{{isa = PBXFileReference; lastKnownFileType = file; path = "Inter-VariableFont_opsz,wght.ttf"; sourceTree = "<group>"; }};\n'
+    f'\t\t{INTER_ITALIC_REF} /* Inter-Italic-VariableFont_opsz,wght.ttf */ = '
+    f'{{isa = PBXFileReference; lastKnownFileType = file; path = "Inter-Italic-VariableFont_opsz,wght.ttf"; sourceTree = "<group>"; }};\n'
+).encode("ascii")
+
+INTER_GROUP_CHILDREN = (
+    f'\t\t\t\t{INTER_REF} /* Inter-VariableFont_opsz,wght.ttf */,\n'
+    f'\t\t\t\t{INTER_ITALIC_REF} /* Inter-Italic-VariableFont_opsz,wght.ttf */,\n'
+).encode("ascii")
+
+INTER_RESOURCE_FILES = (
+    f'\t\t\t\t{INTER_BUILD} /* Inter-VariableFont_opsz,wght.ttf in Resources */,\n'
+    f'\t\t\t\t{INTER_ITALIC_BUILD} /* Inter-Italic-VariableFont_opsz,wght.ttf in Resources */,\n'
+).encode("ascii")
+
+FONTS_GROUP_ANCHOR = FONTS_GROUP_UUID.encode("ascii")
+RESOURCES_ANCHOR   = RESOURCES_UUID.encode("ascii")
+
+OVERPASS_TOKEN = b"Overpass"
+
+BUILD_SECTION_MARKER   = b"/* Begin PBXBuildFile section */\n"
+FILEREF_SECTION_MARKER = b"/* Begin PBXFileReference section */\n"
+
+
+def strip_overpass_lines(content):
+    """Drop every line containing 'Overpass', jumping hit-to-hit.
+
+    Instead of visiting each line in Python, bytes.find locates the next
+    token occurrence (CPython's vectorized two-way search), the enclosing
+    line is bounded with rfind/find, and everything between hits is emitted
+    as one chunk — so the loop runs once per Overpass line, not once per
+    line of the file.
+    """
+    out = []
+    pos, n = 0, len(content)
+    while pos < n:
+        hit = content.find(OVERPASS_TOKEN, pos)
+        if hit == -1:
+            out.append(content[pos:])
+            break
+        nl = content.rfind(b"\n", pos, hit)
+        line_start = pos if nl == -1 else nl + 1
+        out.append(content[pos:line_start])
+        line_end = content.find(b"\n", hit)
+        pos = n if line_end == -1 else line_end + 1
+    return b"".join(out)
+
+
+def section_offset(content, marker):
+    """Offset just past a `/* Begin ... section */` marker line."""
+    at = content.find(marker)
+    if at == -1:
+        raise ValueError(f"section marker {marker!r} not found in {PBXPROJ}")
+    return at + len(marker)
+
+
+def block_list_offset(content, uuid):
+    """Offset just past the `children = (` / `files = (` line of the block
+    that `uuid` defines (the UUID also appears as a child of its parent
+    group, so plain find of the UUID alone is not enough)."""
+    pos = 0
+    while True:
+        hit = content.find(uuid, pos)
+        if hit == -1:
+            raise ValueError(f"block {uuid!r} not found in {PBXPROJ}")
+        line_end = content.find(b"\n", hit)
+        if b"= {" in content[hit:line_end]:
+            at = content.find(b"(\n", line_end)
+            if at == -1:
+                raise ValueError(
+                    f"no child/file list after block {uuid!r} in {PBXPROJ}")
+            return at + 2
+        pos = line_end
+
+
+def main():
+    # Memory-map the project file instead of reading it into a bytes object:
+    # strip_overpass_lines/block_list_offset only call find/rfind and slice
+    # out the chunks they keep, so the already-migrated fast path below
+    # touches a few pages and the migration itself materializes the file
+    # once (as the output) rather than input + output.
+    with open(PBXPROJ, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as original:
+
+        # Re-running after a completed migration must not insert duplicate
+        # Inter entries (or rewrite a file Xcode would then re-index).
+        if original.find(OVERPASS_TOKEN) == -1 \
+                and original.find(FONTS_GROUP_ANCHOR) != -1 \
+                and original.find(INTER_REF.encode("ascii")) != -1:
+            print("✅  project.pbxproj already migrated — nothing to do")
+            return
+
+        # ── 1. Remove ALL Overpass lines ──────────────────────────────────────
+        content = strip_overpass_lines(original)
+
+        # ── 2. Locate the four insertion points (a few C-level finds) ─────────
+        inserts = [
+            (section_offset(content, BUILD_SECTION_MARKER),
+             INTER_BUILD_ENTRIES),
+            (section_offset(content, FILEREF_SECTION_MARKER),
+             INTER_FILE_REFS),
+            (block_list_offset(content, FONTS_GROUP_ANCHOR),
+             INTER_GROUP_CHILDREN),
+            (block_list_offset(content, RESOURCES_ANCHOR),
+             INTER_RESOURCE_FILES),
+        ]
+        inserts.sort()
+
+        # ── 3. Splice all four inserts in a single pass ───────────────────────
+        pieces = []
+        prev = 0
+        for offset, text in inserts:
+            pieces.append(content[prev:offset])
+            pieces.append(text)
+            prev = offset
+        pieces.append(content[prev:])
+        content = b"".join(pieces)
+
+        # Length check first — a memcmp against the mapping is only needed in
+        # the (unusual) same-size case. Cheaper than a write plus the Xcode
+        # re-index a touched pbxproj triggers. The write itself goes to a
+        # sibling temp file and lands via os.replace: one big sequential write
+        # on a fresh inode, and a crash mid-write can't corrupt the project
+        # file.
+        changed = len(content) != len(original) or content != original[:]
+
+    if changed:
+        tmp = PBXPROJ + ".tmp"
+        with open(tmp, "wb", buffering=BUFFER_SIZE) as f:
+            f.write(content)
+        os.replace(tmp, PBXPROJ)
+
+    remaining = content.count(b"Overpass")
+    print("✅  project.pbxproj updated")
+    print(f"    Remaining 'Overpass' references: {remaining}  (expected 0)")
+    print(f"    'Inter' references: {content.count(b'Inter')}")
+    assert remaining == 0, f"FAIL: {remaining} Overpass references remain"
+
+
+if __name__ == "__main__":
+    main()
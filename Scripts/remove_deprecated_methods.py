@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Remove every `@available(*, deprecated, ...)` method from a Swift file.
+
+Used for the TransactionsViewModel simplification (19 methods, -397 lines);
+kept around for future ViewModel cleanups. Matches whole method bodies by
+brace balancing, deletes them, then collapses the empty lines left behind.
+Run from repo root: python3 Scripts/remove_deprecated_methods.py [file]
+"""
+
+import re
+import sys
+
+FILE_PATH = "Tenra/ViewModels/TransactionsViewModel.swift"
+
+DEPRECATED_RE = re.compile(r'@available\(\*,\s*deprecated')
+FUNC_RE       = re.compile(r'func\s+(\w+)')
+EMPTY_RUN_RE  = re.compile(r'\n{3,}')
+
+
+def read_file(path):
+    with open(path) as f:
+        return f.read()
+
+
+def write_file(path, content):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def find_annotated_func(content, attr_end):
+    """Match `func` on the declaration the @available attribute annotates.
+
+    The declaration is either the remainder of the attribute's own line or
+    the first following line that isn't another attribute, a comment, or
+    blank. Bounding the search that tightly keeps a deprecated var/let/init
+    from latching onto the next func further down the file.
+    """
+    line_end = content.find("\n", attr_end)
+    if line_end == -1:
+        line_end = len(content)
+    func = FUNC_RE.search(content, attr_end, line_end)
+
+    pos = line_end + 1
+    while func is None and pos < len(content):
+        line_end = content.find("\n", pos)
+        if line_end == -1:
+            line_end = len(content)
+        stripped = content[pos:line_end].lstrip()
+        if stripped and not stripped.startswith(("@", "//")):
+            return FUNC_RE.search(content, pos, line_end)
+        pos = line_end + 1
+    return func
+
+
+def find_deprecated_methods(content):
+    """Locate deprecated methods as (name, start_offset, end_offset) tuples.
+
+    Offsets are byte positions into `content`: start is the beginning of the
+    @available line, end is just past the closing brace's newline.
+
+    Brace matching alternates content.find('{')/content.find('}') so depth
+    tracking stays inside CPython's C substring search instead of walking the
+    file character-by-character in Python.
+    """
+    methods = []
+    for marker in DEPRECATED_RE.finditer(content):
+        # Block starts at the beginning of the @available line.
+        start = content.rfind("\n", 0, marker.start()) + 1
+
+        func = find_annotated_func(content, marker.end())
+        if func is None:
+            line_no = content.count("\n", 0, marker.start()) + 1
+            print(f"   ⚠️  Skipping deprecated non-func declaration "
+                  f"at line {line_no}")
+            continue
+        name = func.group(1)
+
+        depth = 0
+        pos = content.find("{", func.end())
+        # A bodyless declaration (e.g. a protocol requirement) has no `{` at
+        # all, or a `}` closing the enclosing scope before the next `{` —
+        # matching braces from there would swallow unrelated code below.
+        first_close = content.find("}", func.end())
+        if pos == -1 or (first_close != -1 and first_close < pos):
+            raise ValueError(f"no method body found for {name}")
+        while pos != -1:
+            depth += 1 if content[pos] == "{" else -1
+            if depth == 0:
+                break
+            next_open  = content.find("{", pos + 1)
+            next_close = content.find("}", pos + 1)
+            if next_close == -1:
+                # still inside the method with no closer left in the file
+                raise ValueError(f"unbalanced braces in {name}")
+            pos = next_close if next_open == -1 or next_close < next_open \
+                else next_open
+        if depth != 0:
+            raise ValueError(f"unbalanced braces in {name}")
+
+        end = content.find("\n", pos)
+        end = len(content) if end == -1 else end + 1
+        methods.append((name, start, end))
+    return methods
+
+
+def remove_deprecated_blocks(content, methods):
+    """Copy the surviving byte ranges between blocks in one pass.
+
+    Operating directly on the string avoids the split('\\n')/join('\\n')
+    round-trip, so peak memory stays at roughly two copies of the file
+    instead of three (string + line list + rejoined string). Line counts in
+    the log come from bounded content.count('\\n', start, end) calls rather
+    than per-block line arithmetic.
+    """
+    pieces = []
+    removed = 0
+    prev = 0
+    for name, start, end in sorted(methods, key=lambda m: m[1]):
+        pieces.append(content[prev:start])
+        count = content.count("\n", start, end)
+        print(f"   ✅ Removed {name}: {count} lines")
+        removed += count
+        prev = end
+    pieces.append(content[prev:])
+    return "".join(pieces), removed
+
+
+def clean_empty_lines(content):
+    """Collapse runs of 3+ newlines left behind by the deletions."""
+    return EMPTY_RUN_RE.sub("\n\n", content)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else FILE_PATH
+
+    print("🔧 Deprecated Methods Remover")
+    print("=" * 70)
+    print(f"\n📂 File: {path}")
+
+    original_content = read_file(path)
+
+    # Fast no-op path: one vectorized substring scan. 'deprecated' is a
+    # superset of anything DEPRECATED_RE can match (its \s* tolerates odd
+    # spacing), so this can never skip a real marker.
+    if "deprecated" not in original_content:
+        print("\n✅ No deprecated methods found — nothing to do")
+        return
+
+    original_lines = original_content.count("\n") + 1
+    print(f"📖 Original file: {original_lines:,} lines")
+
+    methods = find_deprecated_methods(original_content)
+    print(f"\n🔍 Found {len(methods)} deprecated methods")
+
+    # Zero matches (e.g. 'deprecated' only in a comment) must not mutate the
+    # file — without this, clean_empty_lines would still collapse blank-line
+    # runs unrelated to any removal.
+    if not methods:
+        print("\n✅ Nothing to remove — file left untouched")
+        return
+
+    print("\n🗑️  Removing deprecated methods...")
+    stripped, removed = remove_deprecated_blocks(original_content, methods)
+    cleaned_content = clean_empty_lines(stripped)
+
+    cleaned_lines = cleaned_content.count("\n") + 1
+    print(f"\n📊 Total lines removed: {removed}")
+    print("\n📊 Summary:")
+    print(f"   Original lines: {original_lines:,}")
+    print(f"   Cleaned lines:  {cleaned_lines:,}")
+
+    if cleaned_content == original_content:
+        print("\n💾 No changes — write skipped")
+    else:
+        write_file(path, cleaned_content)
+        print("\n💾 File written successfully")
+    print("\n✅ SUCCESS! Deprecated methods removed.")
+
+
+if __name__ == "__main__":
+    main()